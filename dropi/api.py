@@ -47,6 +47,39 @@ class ApiRequest(TypedDict):
     """The request's payload. Can be empty"""
 
 
+class ApiPlan(TypedDict):
+    """A TypedDict to represent the estimated cost of a bulk job.
+
+    Returned by :meth:`~.Api42.plan_get` and :meth:`~.Api42.plan_mass_request`
+    without running the job itself.
+
+    .. code-block:: python
+        :linenos:
+
+        import dropi
+
+        api = dropi.Api42()
+        plan = api.plan_get("campus/38/users")
+
+        if not plan['exhausts_quota']:
+            users = api.get("campus/38/users")
+    """
+    requests: int
+    """The number of requests the job will send."""
+    hourly_limit: int
+    """The hourly requests quota of the app."""
+    hourly_remaining: int
+    """The requests left in the current hour, before the job runs."""
+    budget: float
+    """The share of :attr:`hourly_limit` the job will consume, ``1.0`` being
+        the whole quota.
+    """
+    duration: float
+    """The projected duration of the job, in seconds."""
+    exhausts_quota: bool
+    """``True`` if the job needs more than :attr:`hourly_remaining` requests."""
+
+
 class Api42(object):
     """An interface to request 42 intra's api.
 
@@ -79,6 +112,8 @@ class Api42(object):
         self.__log_lvl = log_lvl
         self.__max_poolsize = config.max_poolsize
         self.__raises = raises
+        self.__hourly_limit = config.hourly_limit
+        self.__hourly_remaining = None
         self.headers = {"Authorization": f"Bearer {self.token}", }
 
     @property
@@ -127,6 +162,14 @@ class Api42(object):
             return
         self.__log("INFO", msg)
 
+    def __update_ratelimit(self, resp):
+        # Keeps the last hourly quota seen from intra for plan_mass_request
+        if 'x-hourly-ratelimit-limit' in resp.headers:
+            self.__hourly_limit = int(resp.headers['x-hourly-ratelimit-limit'])
+        if 'x-hourly-ratelimit-remaining' in resp.headers:
+            self.__hourly_remaining = int(
+                resp.headers['x-hourly-ratelimit-remaining'])
+
     def __refresh_token(self):
         self.token.refresh()
         self.headers = {"Authorization": f"Bearer {self.token}", }
@@ -169,6 +212,7 @@ class Api42(object):
                 self.debug(f"sending request: {request}")
 
                 resp = func(self, request)
+                self.__update_ratelimit(resp)
                 resp.raise_for_status()
                 self.debug(f"response: {resp.status_code}")
                 return resp.json() if resp.content else {}
@@ -189,13 +233,46 @@ class Api42(object):
                             headers=self.headers,
                             json=req['payload'])
 
+    def __get_page(self, url: str, data: dict, number: int = None):
+        pl = {}
+        pl.update(data)
+        if number is not None:
+            pl['page'] = dict(data['page'], number=number)
+
+        if self.token.needs_refresh():
+            self.__refresh_token()
+
+        self.debug(f"sending request: {url} (page {pl['page'].get('number', 1)})")
+
+        r = requests.get(f"{config.endpoint}/{url}",
+                        json=pl,
+                        headers=self.headers)
+        self.debug(f"after request: {r.status_code}")
+
+        self.__update_ratelimit(r)
+        r.raise_for_status()
+        return r
+
     def get(self,
             url: str,
             data: dict = {},
             scrap: bool = True,
-            multithreaded: bool = True):
+            multithreaded: bool = True,
+            prefetch: int = 1):
         """Sends a GET request to 42 intra's api.
 
+        Pages are requested with :data:`~.config.page_size` items (``100``,
+        intra's maximum) unless ``data`` provides a ``page[size]``. The page
+        size isn't chosen per endpoint: if intra serves less items than
+        requested, the ``x-per-page`` header is used to count the remaining
+        pages.
+
+        If scrap and multithreaded are enabled and ``prefetch`` is more than
+        ``1``, the first ``prefetch`` pages are requested concurrently,
+        before knowing how many pages there are. Pages beyond ``x-total``
+        are discarded and the remaining ones are fetched through
+        :meth:`~.mass_request`.
+
         Args:
             url (string): the requested URL, without the api.intra.42.fr/v2 prefix
             data (dict): the request's payload
@@ -204,6 +281,14 @@ class Api42(object):
             multithreaded (bool, optional): If ``True`` and scrap is enabled,
                 will fetch all pages concurrently (see :meth:`~.mass_request`
                 for more details). Defaults to ``True``
+            prefetch (int, optional): The number of pages requested up front,
+                up to :data:`~.max_poolsize`. Only worth raising for paginated
+                scraps, as every prefetched page is sent, even for endpoints
+                returning a single resource. Defaults to ``1``
+
+        Raises:
+            TypeError: if prefetch isn't an int
+            ValueError: if prefetch is inferior to 1
         """
 
         # For the case of GET requests, we'll need to retrieve the headers
@@ -212,37 +297,58 @@ class Api42(object):
         # the response as dict, we'll use the requests.get method directly
         # to know the numbers of pages (if more than one page of result).
 
-        if not 'page' in data:
-            data['page'] = {'size': 100}
-        elif not 'size' in data['page']:
-            data['page']['size'] = 100
+        if not isinstance(prefetch, int):
+            raise TypeError("prefetch should be an int")
+        elif prefetch < 1:
+            raise ValueError("prefetch should be superior to 1")
 
-        if self.token.needs_refresh():
-            self.__refresh_token()
+        pl = {}
+        pl.update(data)
+        pl['page'] = {'size': config.page_size}
+        pl['page'].update(data.get('page', {}))
 
-        self.debug(f"sending request: {url}")
-
-        r = requests.get(f"https://api.intra.42.fr/v2/{url}",
-                        json=data,
-                        headers=self.headers)
-        self.debug(f"after request: {r.status_code}")
+        nprefetch = 1
+        if scrap is True and multithreaded is True:
+            nprefetch = min(prefetch, self.max_poolsize)
 
-        r.raise_for_status()
+        start_time = time.time()
+        if nprefetch > 1:
+            thpool = ThreadPool(processes=nprefetch)
+            try:
+                resps = [thpool.apply_async(self.__get_page, (url, pl))]
+                resps.extend(thpool.apply_async(self.__get_page, (url, pl, i))
+                             for i in range(2, nprefetch + 1))
+                resps = [r.get() for r in resps]
+            finally:
+                thpool.close()
+        else:
+            resps = [self.__get_page(url, pl)]
 
+        r = resps[0]
         res = r.json()
         if 'x-total' in r.headers and scrap is True:
-            npage = int(r.headers['x-total']) / int(r.headers['x-per-page'])
-            npage = ceil(npage)
+            # intra may serve less items than the requested page[size]
+            pl['page']['size'] = int(r.headers['x-per-page'])
+            npage = ceil(int(r.headers['x-total']) / pl['page']['size'])
+
+            for r in resps[1:npage]:
+                res.extend(r.json())
 
             reqs = []
-            for i in range(2, npage + 1):
-                pl = {}
-                pl.update(data)
-                pl['page'] = {'number': i, 'size': data['page']['size']}
+            for i in range(len(resps) + 1, npage + 1):
+                rpl = {}
+                rpl.update(pl)
+                rpl['page'] = {'number': i, 'size': pl['page']['size']}
                 reqs.append({'endpoint': url,
-                    'payload': pl,
+                    'payload': rpl,
                 })
 
+            if reqs and nprefetch > 1:
+                # The prefetched pages were a batch of their own
+                delta_time = 1.1 - (time.time() - start_time)
+                if delta_time > 0:
+                    time.sleep(delta_time)
+
             res.extend(
                 self.mass_request(
                     "GET",
@@ -407,3 +513,134 @@ class Api42(object):
                 res.extend(req_func(req).json())
 
         return res
+
+    def __plan(self,
+               nreq: int,
+               multithreaded: bool,
+               latency: float,
+               hourly_limit: int,
+               hourly_remaining: int,
+               lead: int = 0) -> ApiPlan:
+        # lead requests are sent in a single batch before the nreq others,
+        # which are sent like mass_request does.
+        if multithreaded is True:
+            batches = ceil(nreq / self.max_poolsize)
+            if lead > 1:
+                batches += 1
+            # Each batch takes at least 1.1 seconds, the last one only as
+            # long as its requests.
+            duration = (batches - 1) * max(1.1, latency) + latency \
+                if batches else 0
+            if lead == 1:
+                # A single lead request isn't throttled
+                duration += latency
+        else:
+            duration = (nreq + lead) * latency
+
+        total = lead + nreq
+        plan = ApiPlan(requests=total,
+                       hourly_limit=hourly_limit,
+                       hourly_remaining=hourly_remaining,
+                       budget=total / hourly_limit,
+                       duration=duration,
+                       exhausts_quota=total > hourly_remaining)
+
+        if plan['exhausts_quota']:
+            self.error(f"job needs {total} requests but only "
+                       f"{hourly_remaining}/{hourly_limit} are left this hour")
+        self.debug(f"plan: {plan}")
+        return plan
+
+    def plan_get(self,
+                 url: str,
+                 data: dict = {},
+                 scrap: bool = True,
+                 multithreaded: bool = True,
+                 prefetch: int = 1) -> ApiPlan:
+        """Estimates the cost of a :meth:`~.get` without running it.
+
+        Sends a single first page request to read the ``x-total`` header
+        and intra's rate limit headers, then projects the number of requests
+        and the duration of the same :meth:`~.get` call under the current
+        :data:`~.max_poolsize`.
+
+        The probe request itself isn't counted in the plan, but is counted
+        in intra's quota.
+
+        Args:
+            url (string): the requested URL, without the api.intra.42.fr/v2 prefix
+            data (dict): the request's payload
+            scrap (bool, optional): See :meth:`~.get`. Defaults to ``True``
+            multithreaded (bool, optional): See :meth:`~.get`. Defaults to
+                ``True``
+            prefetch (int, optional): See :meth:`~.get`. Defaults to ``1``
+
+        Returns:
+            :class:`~.ApiPlan`: the estimated cost of the job.
+        """
+        pl = {}
+        pl.update(data)
+        pl['page'] = {'size': config.page_size}
+        pl['page'].update(data.get('page', {}))
+
+        self.debug(f"sending probe request: {url}")
+        r = self.__get_page(url, pl)
+
+        hourly_limit = self.__hourly_limit
+        hourly_remaining = self.__hourly_remaining
+        if hourly_remaining is None:
+            hourly_remaining = hourly_limit
+        latency = r.elapsed.total_seconds()
+
+        nprefetch = 1
+        if scrap is True and multithreaded is True:
+            nprefetch = min(prefetch, self.max_poolsize)
+
+        npage = 1
+        if 'x-total' in r.headers and scrap is True:
+            npage = ceil(int(r.headers['x-total'])
+                         / int(r.headers['x-per-page']))
+
+        # get() fetches the first pages in a single batch, then the others
+        # through mass_request
+        return self.__plan(max(npage - nprefetch, 0), multithreaded, latency,
+                           hourly_limit, hourly_remaining, lead=nprefetch)
+
+    def plan_mass_request(self,
+                          req_type: str,
+                          requests: list[ApiRequest],
+                          multithreaded: bool = True,
+                          hourly_remaining: int = None) -> ApiPlan:
+        """Estimates the cost of a :meth:`~.mass_request` without running it.
+
+        No request is sent: the hourly quota is the last one seen in intra's
+        rate limit headers by this instance, or
+        :data:`~.config.hourly_limit` with every request left if none was
+        seen yet. Each request is assumed to take
+        :data:`~.config.request_latency` seconds.
+
+        Args:
+            req_type (str): See :meth:`~.mass_request`
+            requests (list of :class:`~.ApiRequest`): See :meth:`~.mass_request`
+            multithreaded (bool, optional): See :meth:`~.mass_request`.
+                Defaults to ``True``
+            hourly_remaining (int, optional): The requests left in the
+                current hour, overrides the last value seen from intra.
+
+        Raises:
+            Exception: for an invalid ``req_type``
+
+        Returns:
+            :class:`~.ApiPlan`: the estimated cost of the job.
+        """
+        if req_type not in ("GET", "POST", "PATCH", "DELETE"):
+            raise Exception(f"Invalid or empty request type '{req_type}'")
+
+        if hourly_remaining is None:
+            hourly_remaining = self.__hourly_remaining
+        if hourly_remaining is None:
+            hourly_remaining = self.__hourly_limit
+
+        return self.__plan(len(requests), multithreaded,
+                           config.request_latency,
+                           self.__hourly_limit, hourly_remaining)
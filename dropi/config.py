@@ -35,6 +35,27 @@ max_poolsize = 3
         # Do stuff
 """
 
+page_size = 100
+"""The number of items per page requested by :meth:`~.Api42.get`, defaults
+    to ``100``, the largest page size intra accepts.
+"""
+
+hourly_limit = 1200
+"""The default hourly requests quota of a 42 app, defaults to ``1200``.
+
+    Only used by :meth:`~.Api42.plan_get` and
+    :meth:`~.Api42.plan_mass_request` when intra's response doesn't provide
+    the ``x-hourly-ratelimit-limit`` header.
+"""
+
+request_latency = 0.5
+"""The estimated duration of a single request, in seconds, defaults to
+    ``0.5``.
+
+    Used by :meth:`~.Api42.plan_mass_request` to project the duration of
+    requests that aren't throttled by batch.
+"""
+
 class LogLvl(IntEnum):
     """:class:`~.Api42` logging level.
 
@@ -2,6 +2,9 @@ import dropi
 import unittest
 import pprint as pp
 import time
+from math import ceil
+from unittest import mock
+import requests
 
 class TestAPI(unittest.TestCase):
 
@@ -120,5 +123,96 @@ class TestAPI(unittest.TestCase):
         for r in response:
             self.assertTrue(r['pool_year'] in ['2020','2021'])
 
+    def test_can_plan_a_scrap_before_running_it(self):
+        endpoint = 'campus/38/users'
+
+        plan = self.api.plan_get(endpoint)
+        response = self.api.get(endpoint)
+        npage = ceil(len(response) / dropi.config.page_size)
+        self.assertTrue(plan['requests'] == max(npage, 1))
+        self.assertTrue(plan['budget'] == plan['requests'] / plan['hourly_limit'])
+
+    def test_can_plan_a_mass_request(self):
+        reqs = [{
+                'endpoint': f'users/{i}/correction_points/add',
+                'payload': {"id": i, "reason": "Staff is testing stuff"},
+                } for i in range(10)]
+        latency = dropi.config.request_latency
+
+        plan = self.api.plan_mass_request("POST", reqs, hourly_remaining=1000)
+        batches = ceil(10 / self.api.max_poolsize)
+        self.assertTrue(plan['requests'] == 10)
+        self.assertAlmostEqual(plan['duration'],
+                               (batches - 1) * max(1.1, latency) + latency)
+        self.assertFalse(plan['exhausts_quota'])
+
+        plan = self.api.plan_mass_request("POST", reqs, multithreaded=False)
+        self.assertAlmostEqual(plan['duration'], 10 * latency)
+
+    def test_plan_flags_quota_exhaustion(self):
+        reqs = [{'endpoint': 'cursus', 'payload': {}} for i in range(10)]
+
+        plan = self.api.plan_mass_request("GET", reqs, hourly_remaining=10)
+        self.assertFalse(plan['exhausts_quota'])
+        plan = self.api.plan_mass_request("GET", reqs, hourly_remaining=9)
+        self.assertTrue(plan['exhausts_quota'])
+
+    def test_plan_rejects_invalid_request_type(self):
+        with self.assertRaises(Exception):
+            self.api.plan_mass_request("FETCH", [])
+
+    def test_prefetched_pages_match_serial_pages(self):
+        endpoint = 'campus'
+        params = {
+            'sort': 'id',
+            'page': {
+                'size': 10
+                }
+            }
+
+        response = self.api.get(endpoint, data=params, prefetch=3)
+        serial = self.api.get(endpoint, data=params)
+        self.assertTrue([r['id'] for r in response] == [r['id'] for r in serial])
+
+    def test_GET_of_a_single_resource_sends_one_request(self):
+        with mock.patch('dropi.api.requests.get', wraps=requests.get) as get:
+            response = self.api.get("campus/38")
+        self.assertTrue(get.call_count == 1)
+        self.assertTrue(response['id'] == 38)
+
+    def test_GET_of_a_one_page_collection_sends_one_request(self):
+        params = {
+            'filter': {
+                'city': 'Lisboa'
+                }
+            }
+
+        with mock.patch('dropi.api.requests.get', wraps=requests.get) as get:
+            response = self.api.get('campus', data=params)
+        self.assertTrue(get.call_count == 1)
+        self.assertTrue(len(response) == 1)
+
+    def test_can_page_params_on_request(self):
+        endpoint = 'campus'
+        params = {
+            'sort': 'id',
+            'page': {
+                'number': 2,
+                'size': 1
+                }
+            }
+
+        with mock.patch('dropi.api.requests.get', wraps=requests.get) as get:
+            response = self.api.get(endpoint, data=params, scrap=False)
+        self.assertTrue(get.call_count == 1)
+        self.assertTrue(get.call_args.kwargs['json']['page']['number'] == 2)
+        self.assertTrue(response[0]['id'] == 2)
+
+    def test_prefetch_must_be_a_positive_int(self):
+        with self.assertRaises(ValueError):
+            self.api.get('campus', prefetch=0)
+        with self.assertRaises(TypeError):
+            self.api.get('campus', prefetch='3')
+
 if __name__ == '__main__':
     unittest.main()